@@ -9,13 +9,13 @@ import os
 from datetime import date, timedelta
 from dotenv import load_dotenv
 
-from google_ads_reports import GAdsReport, GAdsReportModel, setup_logging
+from google_ads_reports import GAdsReportModel, get_shared_client, setup_logging
+from google_ads_reports.exceptions import ValidationError
 from google_ads_reports.utils import (
     load_credentials,
     create_output_directory,
     format_report_filename,
-    save_report_to_csv,
-    get_records_info,
+    validate_customer_id,
 )
 
 
@@ -32,52 +32,58 @@ def main():
         logging.error(f"Error: {e}")
         return
 
-    # Initialize the Google Ads client
-    gads_client = GAdsReport(client_secret=credentials)
-
     # Configuration
     load_dotenv()
     customer_id = os.getenv("CUSTOMER_ID") or "1234567890"  # Replace with your actual customer ID
-    start_date = date.today() - timedelta(days=7)  # Last 7 days
-    end_date = date.today() - timedelta(days=1)    # Until yesterday
+
+    # Validate the customer ID before any network I/O (including the OAuth
+    # exchange done by client construction) so a misconfigured environment
+    # fails immediately instead of burning API round-trips and retry backoff
+    try:
+        customer_id = validate_customer_id(customer_id)
+    except ValidationError as e:
+        logging.error(f"Invalid CUSTOMER_ID: {e}")
+        return
+
+    # Initialize the Google Ads client (shared/memoized per credentials)
+    gads_client = get_shared_client(credentials)
+
+    today = date.today()
+    start_date = today - timedelta(days=7)  # Last 7 days
+    end_date = today - timedelta(days=1)    # Until yesterday
+    start_iso = start_date.isoformat()
+    end_iso = end_date.isoformat()
 
     # Get the adgroup ad report
     report_model = GAdsReportModel.adgroup_ad_report
 
     try:
-        # Extract the report data
-        logging.info(f"Extracting '{report_model['report_name']}' for customer '{customer_id}'\n")
-        response_data = gads_client.get_gads_report(customer_id, report_model,
-                                                    start_date, end_date,
-                                                    filter_zero_impressions=True,
-                                                    column_naming="snake_case")
-
-        # Save to file
+        # Build the output path
         output_filename = format_report_filename(
             customer_id=customer_id,
             report_name=report_model['report_name'],
-            start_date=start_date.isoformat(),
-            end_date=end_date.isoformat(),
+            start_date=start_iso,
+            end_date=end_iso,
             file_extension="csv"
         )
 
         output_dir = create_output_directory("reports_output")
         file_path = output_dir / output_filename
-        save_report_to_csv(response_data, str(file_path))
+
+        # Stream the report data page-by-page straight into the CSV file,
+        # avoiding holding the full result set in memory
+        logging.info(f"Extracting '{report_model['report_name']}' for customer '{customer_id}'\n")
+        gads_client.stream_gads_report_to_csv(customer_id, report_model,
+                                              start_date, end_date,
+                                              filepath=str(file_path),
+                                              filter_zero_impressions=True,
+                                              column_naming="snake_case")
 
         # Display basic info
-        info = get_records_info(response_data)
         print("\nReport Summary:")
-        print(f"- Rows: {info['shape'][0]}")
-        print(f"- Columns: {info['shape'][1]}")
         print(f"- Date range: {start_date} to {end_date}")
         print(f"- Output file: {file_path}")
 
-        # Show column names
-        print("\nColumns:")
-        for i, col in enumerate(info['columns'], 1):
-            print(f"  {i}. {col}")
-
     except Exception as e:
         logging.error(f"Error extracting report: {e}")
         raise
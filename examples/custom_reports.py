@@ -8,72 +8,67 @@ import logging
 from datetime import date, timedelta
 
 from google_ads_reports import (
-    GAdsReport, create_custom_report, load_credentials, setup_logging,
-    save_report_to_csv, get_records_info
+    create_custom_report, get_shared_client, load_credentials, setup_logging,
+    save_report_to_csv, get_records_info, peek_records, validate_customer_id
+)
+from google_ads_reports.exceptions import ValidationError
+
+
+# Field selections are static, so define them once at module scope as
+# immutable tuples instead of rebuilding a list on every call
+_CAMPAIGN_PERF_FIELDS: tuple[str, ...] = (
+    "campaign.id",
+    "campaign.name",
+    "campaign.status",
+    "campaign.advertising_channel_type",
+    "segments.date",
+    "metrics.impressions",
+    "metrics.clicks",
+    "metrics.ctr",
+    "metrics.average_cpc",
+    "metrics.cost_micros",
+    "metrics.conversions",
+    "metrics.conversions_value",
+    "metrics.cost_per_conversion",
+)
+
+_AD_GROUP_QUALITY_FIELDS: tuple[str, ...] = (
+    "ad_group.id",
+    "ad_group.name",
+    "campaign.name",
+    "segments.date",
+    "metrics.impressions",
+    "metrics.clicks",
+    "metrics.ctr",
+    "metrics.average_cpc",
+    "metrics.quality_score",
+    "metrics.search_impression_share",
+    "metrics.search_rank_lost_impression_share",
 )
 
 
 def create_campaign_performance_report():
     """Create a custom campaign performance report."""
-
-    # Define custom fields for campaign performance
-    custom_fields = [
-        "campaign.id",
-        "campaign.name",
-        "campaign.status",
-        "campaign.advertising_channel_type",
-        "segments.date",
-        "metrics.impressions",
-        "metrics.clicks",
-        "metrics.ctr",
-        "metrics.average_cpc",
-        "metrics.cost_micros",
-        "metrics.conversions",
-        "metrics.conversions_value",
-        "metrics.cost_per_conversion",
-    ]
-
-    # Create the custom report model
-    campaign_report = create_custom_report(
+    return create_custom_report(
         report_name="custom_campaign_performance",
-        select=custom_fields,
+        select=_CAMPAIGN_PERF_FIELDS,
         from_table="campaign",
         order_by="metrics.cost_micros",
         table_name="custom_campaign_perf"
     )
 
-    return campaign_report
-
 
 def create_ad_group_quality_report():
-    """Create a custom ad group quality report."""
-
-    quality_fields = [
-        "ad_group.id",
-        "ad_group.name",
-        "campaign.name",
-        "segments.date",
-        "metrics.impressions",
-        "metrics.clicks",
-        "metrics.ctr",
-        "metrics.average_cpc",
-        "metrics.quality_score",
-        "metrics.search_impression_share",
-        "metrics.search_rank_lost_impression_share",
-    ]
-
-    # Create custom report with WHERE clause
-    quality_report = create_custom_report(
+    """Create a custom ad group quality report with a WHERE clause."""
+    return create_custom_report(
         report_name="ad_group_quality_analysis",
-        select=quality_fields,
+        select=_AD_GROUP_QUALITY_FIELDS,
         from_table="ad_group",
         order_by="metrics.quality_score",
         where="metrics.impressions > 100",  # Only ad groups with significant impressions
         table_name="ad_group_quality"
     )
 
-    return quality_report
-
 
 def main():
     """Main function to demonstrate custom reports."""
@@ -87,13 +82,24 @@ def main():
         logging.error("Could not find credentials file")
         return
 
-    # Initialize client
-    gads_client = GAdsReport(credentials)
-
     # Configuration
     customer_id = "1234567890"  # Replace with your actual customer ID
-    start_date = date.today() - timedelta(days=14)  # Last 2 weeks
-    end_date = date.today() - timedelta(days=1)     # Until yesterday
+
+    # Fail fast on an invalid customer ID before the client's OAuth exchange
+    try:
+        customer_id = validate_customer_id(customer_id)
+    except ValidationError as e:
+        logging.error(f"Invalid customer ID: {e}")
+        return
+
+    # Initialize client (shared/memoized per credentials)
+    gads_client = get_shared_client(credentials)
+
+    today = date.today()
+    start_date = today - timedelta(days=14)  # Last 2 weeks
+    end_date = today - timedelta(days=1)     # Until yesterday
+    start_iso = start_date.isoformat()
+    end_iso = end_date.isoformat()
 
     # Create and run custom reports
     custom_reports = [
@@ -114,7 +120,7 @@ def main():
             )
 
             # Save the results
-            filename = f"custom_{report_model['report_name']}_{start_date}_{end_date}.csv"
+            filename = f"custom_{report_model['report_name']}_{start_iso}_{end_iso}.csv"
             save_report_to_csv(response_data, filename)
 
             info = get_records_info(response_data)
@@ -131,16 +137,17 @@ def main():
             # Show top performing items (first 5 rows)
             if response_data:  # Check if data is not empty
                 print("- Top 5 results:")
-                first_records = response_data[:5]
+                first_records = peek_records(response_data, n=5)
 
-                for i, record in enumerate(first_records, 1):
-                    if 'campaign_name' in info['columns']:
-                        name_col = 'campaign_name'
-                    elif 'ad_group_name' in info['columns']:
-                        name_col = 'ad_group_name'
-                    else:
-                        name_col = info['columns'][1] if len(info['columns']) > 1 else info['columns'][0]
+                # The display column is the same for every row, so pick it once
+                if 'campaign_name' in info['columns']:
+                    name_col = 'campaign_name'
+                elif 'ad_group_name' in info['columns']:
+                    name_col = 'ad_group_name'
+                else:
+                    name_col = info['columns'][1] if len(info['columns']) > 1 else info['columns'][0]
 
+                for i, record in enumerate(first_records, 1):
                     print(f"  {i}. {record.get(name_col, 'N/A')}")
 
             print("-" * 50)
@@ -17,6 +17,7 @@ from .exceptions import (
 )
 from .models import GAdsReportModel, create_custom_report
 from .utils import (
+    get_shared_client,
     load_credentials,
     validate_customer_id,
     get_month_date_pairs,
@@ -25,6 +26,8 @@ from .utils import (
     save_report_to_csv,
     save_report_to_json,
     get_records_info,
+    add_derived_metrics,
+    peek_records,
 )
 
 # Main exports
@@ -34,6 +37,7 @@ __all__ = [
     "GAdsReportModel",
     "create_custom_report",
     # Utils
+    "get_shared_client",
     "load_credentials",
     "validate_customer_id",
     "get_month_date_pairs",
@@ -42,6 +46,8 @@ __all__ = [
     "save_report_to_csv",
     "save_report_to_json",
     "get_records_info",
+    "add_derived_metrics",
+    "peek_records",
     # Exceptions
     "GAdsReportError",
     "AuthenticationError",
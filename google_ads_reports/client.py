@@ -3,17 +3,31 @@ Google Ads API client module.
 
 This module contains the main GAdsReport class for interacting with the Google Ads API.
 """
+import concurrent.futures
+import csv
+import enum
+import functools
 import logging
+import re
 import socket
 import tempfile
+import time
 import os
 
-from datetime import date, datetime
+from collections.abc import Iterator
+from datetime import date
 from dotenv import load_dotenv
-from google.ads.googleads.client import GoogleAdsClient
-from google.protobuf.json_format import MessageToDict
+
+# Prefer the upb (C) protobuf implementation before any google.* import pins
+# the runtime; the pure-Python fallback parses messages orders of magnitude
+# slower. A user-provided setting is respected.
+os.environ.setdefault("PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION", "upb")
+
+from google.ads.googleads.client import GoogleAdsClient  # noqa: E402
+from google.ads.googleads.errors import GoogleAdsException  # noqa: E402
+from operator import attrgetter
 from typing import Any
-from .exceptions import AuthenticationError, DataProcessingError, ValidationError
+from .exceptions import AuthenticationError, ConfigurationError, DataProcessingError, ValidationError
 from .retry import retry_on_api_error
 
 # Python 3.12+ type aliases for better readability
@@ -26,6 +40,12 @@ type APIResponse = dict[str, Any]
 TIMEOUT_IN_SEC = 60 * 3  # seconds timeout limit
 socket.setdefaulttimeout(TIMEOUT_IN_SEC)
 
+# Resource prefixes stripped from report column names
+_COLUMN_PREFIX_RE = re.compile(r"^(?:segments|ad_group_criterion|metrics)\.")
+
+# Drops null bytes and normalizes line breaks in one C-level pass
+_TEXT_CLEAN_TABLE = str.maketrans({"\x00": None, "\r": " ", "\n": " "})
+
 
 class GAdsReport:
     """
@@ -39,16 +59,24 @@ class GAdsReport:
     Optimized for serverless environments by removing heavy dependencies like pandas
     and using pure Python data structures for better cold start performance.
 
+    Instances are designed to be reused: one GAdsReport can serve many report
+    calls (and many customer IDs) over a single authenticated gRPC channel,
+    amortizing the TLS handshake and OAuth token exchange. Prefer keeping one
+    instance per credential set — e.g. via utils.get_shared_client — instead
+    of constructing a new client per report.
+
     Parameters:
         client_secret (dict[str, Any] | None): Google Ads API authentication configuration
 
     Methods:
         get_gads_report: Main method to retrieve and process Google Ads report data
+        get_gads_reports_bulk: Fetches the same report for many customer IDs concurrently
+        iter_gads_report: Yields report rows lazily with bounded memory
         get_default_report: Alias for get_gads_report (backward compatibility)
 
     Private Methods:
         _build_gads_query: Constructs GAQL queries for the Google Ads API
-        _get_google_ads_response: Executes API requests with retry logic and pagination
+        _get_google_ads_response: Executes streaming API requests with retry logic
         _convert_response_to_records: Converts protobuf responses to list of dictionaries
         _handle_missing_values: Configurable None handling for different value types
         _clean_text_encoding: Cleans text values for database compatibility
@@ -60,18 +88,42 @@ class GAdsReport:
         DataProcessingError: API response processing failures
     """
 
-    def __init__(self, client_secret: ReportModel | None = None):
+    # Authenticated GoogleAdsClient instances shared across GAdsReport
+    # objects, keyed by the credential contents. Pipelines instantiating one
+    # GAdsReport per account then reuse a single gRPC channel (HTTP/2
+    # multiplexes concurrent streams) instead of re-running the TLS handshake
+    # and OAuth exchange per instance
+    _client_cache: dict[frozenset, Any] = {}
+
+    def __init__(self, client_secret: ReportModel | None = None,
+                 cache_ttl_seconds: float | None = None):
         """
         Initializes the GAdsReport instance.
 
         Parameters:
         - client_secret (dict): The YAML configuration for authentication.
+        - cache_ttl_seconds (float | None): If set, identical report requests
+          (same customer, query and date range) within this many seconds are
+          served from an in-process cache instead of re-hitting the API.
+          Disabled by default.
 
         Raises:
         - AuthenticationError: If credentials are invalid or authentication fails
         - ValidationError: If client_secret format is invalid
         """
 
+        # Warn loudly if protobuf silently fell back to the pure-Python
+        # implementation, which decodes responses ~10-100x slower
+        try:
+            from google.protobuf.internal import api_implementation
+            if api_implementation.Type() == "python":
+                logging.warning(
+                    "protobuf is using the pure-Python implementation; response parsing "
+                    "will be ~10x slower. Reinstall protobuf with the upb/C++ extension "
+                    "or set PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=upb")
+        except Exception:
+            pass
+
         if client_secret is not None:
             if not isinstance(client_secret, dict):
                 raise ValidationError("client_secret must be a dictionary if provided")
@@ -79,10 +131,25 @@ class GAdsReport:
             if not client_secret:
                 raise ValidationError("client_secret cannot be empty if provided")
 
+            # Credential dicts are flat string mappings, so their items form a
+            # stable cache key; anything unhashable just skips the cache
+            try:
+                client_cache_key = frozenset(client_secret.items())
+            except TypeError:
+                client_cache_key = None
+
             try:
-                # Initialize the Google Ads API client from dict
-                self.client = GoogleAdsClient.load_from_dict(client_secret, version="v21")
-                logging.info("Google Ads client authenticated from provided credentials")
+                cached_client = (self._client_cache.get(client_cache_key)
+                                 if client_cache_key is not None else None)
+                if cached_client is not None:
+                    self.client = cached_client
+                    logging.info("Reusing shared Google Ads client for these credentials")
+                else:
+                    # Initialize the Google Ads API client from dict
+                    self.client = GoogleAdsClient.load_from_dict(client_secret, version="v21")
+                    logging.info("Google Ads client authenticated from provided credentials")
+                    if client_cache_key is not None:
+                        self._client_cache[client_cache_key] = self.client
 
             except Exception as e:
                 logging.error(f"Authentication failed: {e}", exc_info=True)
@@ -115,6 +182,15 @@ class GAdsReport:
         # Lazy initialization of service - only create when needed
         self._service = None
 
+        # Cached request message class; resolved once to skip the descriptor
+        # lookup in get_type on every call (see _new_stream_request)
+        self._stream_request_cls: Any = None
+
+        # Opt-in TTL cache for repeated identical report requests, keyed by
+        # (customer_id, query, naming, convert_micros)
+        self._cache_ttl_seconds = cache_ttl_seconds
+        self._response_cache: dict[tuple, tuple[float, RecordList]] = {}
+
     @property
     def service(self) -> Any:
         """Lazy initialization of Google Ads service for better serverless performance."""
@@ -129,10 +205,26 @@ class GAdsReport:
                 ) from e
         return self._service
 
+    def _new_stream_request(self) -> Any:
+        """
+        Creates a fresh SearchGoogleAdsStreamRequest message.
+
+        The message class is resolved through client.get_type once and cached;
+        each call still constructs a new instance, so concurrent fetches never
+        share (and mutate) the same request object.
+
+        Returns:
+        - Any: Empty SearchGoogleAdsStreamRequest instance
+        """
+        if self._stream_request_cls is None:
+            self._stream_request_cls = type(self.client.get_type("SearchGoogleAdsStreamRequest"))
+        return self._stream_request_cls()
+
     def get_gads_report(self, customer_id: str, report_model: ReportModel,
                         start_date: date, end_date: date,
                         filter_zero_impressions: bool = True,
-                        column_naming: str = "snake_case") -> RecordList:
+                        column_naming: str = "snake_case",
+                        convert_micros: bool = False) -> RecordList:
         """
         Retrieves and processes Google Ads report data for database insertion.
 
@@ -146,11 +238,15 @@ class GAdsReport:
                 optional 'where', 'order_by', and 'report_name' keys
             start_date (date): Report start date (inclusive)
             end_date (date): Report end date (inclusive)
-            filter_zero_impressions (bool): Remove rows with zero impressions.
-                Handles multiple zero formats: 0, "0", 0.0, "0.0", None
+            filter_zero_impressions (bool): Filter rows with zero impressions
+                server-side by appending 'metrics.impressions > 0' to the GAQL
+                WHERE clause (skipped for reports without that metric)
             column_naming (str): Column naming convention. Options:
                 - "snake_case": campaign.name → campaign_name (default)
                 - "camelCase": campaign.name → campaignName
+            convert_micros (bool): Convert *_micros columns from micro-units
+                to standard currency units (divide by 1,000,000) during
+                processing, so consumers skip the per-cell conversion later
 
         Returns:
             RecordList: List of records with:
@@ -164,80 +260,569 @@ class GAdsReport:
             DataProcessingError: Response processing failure
         """
 
-        response = self._get_google_ads_response(customer_id, report_model, start_date, end_date)
+        cache_key = None
+        if self._cache_ttl_seconds is not None:
+            query_str = self._build_gads_query(report_model, start_date, end_date,
+                                               filter_zero_impressions=filter_zero_impressions)
+            cache_key = (customer_id, query_str,
+                         self._normalize_naming(column_naming), convert_micros)
+
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                cached_at, cached_records = cached
+                if time.monotonic() - cached_at < self._cache_ttl_seconds:
+                    logging.info("Serving report from in-process cache")
+                    # Copy the records too: callers (and in-place helpers like
+                    # add_derived_metrics) may mutate them, which must not
+                    # corrupt the cached result
+                    return [dict(record) for record in cached_records]
+                del self._response_cache[cache_key]
+
+        response = self._get_google_ads_response(customer_id, report_model, start_date, end_date,
+                                                 filter_zero_impressions=filter_zero_impressions,
+                                                 column_naming=column_naming)
 
         result_records = self._convert_response_to_records(response, report_model)
 
         if result_records:
-            # Filter out rows with zero impressions (configurable behavior)
-            # Only apply filtering if the data contains impression metrics
-            if filter_zero_impressions and result_records and "metrics.impressions" in result_records[0]:
-                original_count = len(result_records)
-                result_records = [
-                    record for record in result_records
-                    if not self._is_zero_impression_record(record)
-                ]
-                removed_rows = original_count - len(result_records)
-                if removed_rows > 0:
-                    logging.info(f"Filtered out {removed_rows} rows with zero impressions.")
-
-            elif filter_zero_impressions:
-                logging.info("Skipping zero impressions filter: no 'metrics.impressions' column found in data.")
+            # Zero-impression rows are filtered server-side via the GAQL WHERE
+            # clause (see _build_gads_query), so they never cross the wire.
+            # Column names are already final: extraction builds records with
+            # the transformed keys (see _compile_row_extractor)
 
             # Handle missing values for database compatibility
             # result_records = self._handle_missing_values(result_records, fill_object_values="")
 
-            # Clean text encoding for database compatibility
-            result_records = self._clean_text_encoding(result_records)
+            # Convert micro-unit currency columns once, in one pass.
+            # Text encoding cleanup is fused into extraction (see
+            # _specialize_extractor), so no further pass is needed
+            if convert_micros:
+                result_records = self._convert_micros_values(result_records)
 
-            # Transform column names according to specified convention
-            result_records = self._transform_column_names(result_records, naming_convention=column_naming)
+        if cache_key is not None:
+            self._response_cache[cache_key] = (time.monotonic(), result_records)
+            return [dict(record) for record in result_records]
 
         return result_records
 
-    def _build_gads_query(self, report_model: ReportModel, start_date: date, end_date: date) -> str:
+    def get_gads_reports_bulk(self, customer_ids: list[str], report_model: ReportModel,
+                              start_date: date, end_date: date,
+                              max_workers: int = 8,
+                              filter_zero_impressions: bool = True,
+                              column_naming: str = "snake_case",
+                              convert_micros: bool = False) -> dict[str, RecordList]:
         """
-        Creates a query string for the Google Ads API.
+        Retrieves the same report for multiple customer IDs concurrently.
+
+        Each customer is fetched by get_gads_report on its own thread: the
+        underlying gRPC stub releases the GIL during network I/O, so N
+        accounts complete in roughly the time of the slowest one instead of
+        N sequential round-trips. Per-customer retries with exponential
+        backoff are inherited from _get_google_ads_response.
 
         Parameters:
-        - report_model (ReportModel): The report model specifying dimensions, metrics, etc.
-        - start_date (date): Start date for the report.
-        - end_date (date): End date for the report.
+            customer_ids (list[str]): Google Ads customer IDs to fetch
+            report_model (ReportModel): Report configuration (same as get_gads_report)
+            start_date (date): Report start date (inclusive)
+            end_date (date): Report end date (inclusive)
+            max_workers (int): Maximum concurrent API calls (default 8);
+                keep below per-customer API quota limits
+            filter_zero_impressions (bool): Filter rows with zero impressions server-side
+            column_naming (str): Column naming convention ("snake_case" or "camelCase")
+            convert_micros (bool): Convert *_micros columns to standard currency units
 
         Returns:
-        - str: The constructed query string.
+            dict[str, RecordList]: Mapping of customer ID to its records
+
+        Raises:
+            ValidationError: Invalid parameters or report model
+            AuthenticationError: API authentication failure
+            DataProcessingError: Response processing failure for any customer
+        """
+        if not customer_ids:
+            raise ValidationError("customer_ids must be a non-empty list")
+
+        results: dict[str, RecordList] = {}
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self.get_gads_report, customer_id, report_model,
+                    start_date, end_date,
+                    filter_zero_impressions=filter_zero_impressions,
+                    column_naming=column_naming,
+                    convert_micros=convert_micros
+                ): customer_id
+                for customer_id in customer_ids
+            }
+
+            for future in concurrent.futures.as_completed(futures):
+                customer_id = futures[future]
+                results[customer_id] = future.result()
+                logging.info(f"Bulk fetch completed for customer {customer_id} "
+                             f"({len(results)}/{len(customer_ids)})")
+
+        return results
+
+    def iter_gads_report(self, customer_id: str, report_model: ReportModel,
+                         start_date: date, end_date: date,
+                         filter_zero_impressions: bool = True,
+                         column_naming: str = "snake_case") -> Iterator[Record]:
+        """
+        Iterates over report rows as they arrive from the API stream.
+
+        Unlike get_gads_report, at most one stream batch of records exists in
+        memory at a time, so arbitrarily large reports can be consumed with
+        bounded memory. Records are identical to get_gads_report output
+        (renamed keys, cleaned text), just yielded one at a time.
+
+        Note: because rows are produced lazily, API errors surface during
+        iteration rather than at the call site, and the automatic retry of
+        get_gads_report does not apply here.
+
+        Parameters:
+            customer_id (str): Google Ads customer ID
+            report_model (ReportModel): Report configuration (same as get_gads_report)
+            start_date (date): Report start date (inclusive)
+            end_date (date): Report end date (inclusive)
+            filter_zero_impressions (bool): Filter rows with zero impressions server-side
+            column_naming (str): Column naming convention ("snake_case" or "camelCase")
+
+        Yields:
+            Record: One report row at a time, in stream order
+
+        Raises:
+            ValidationError: Invalid parameters or report model
+            GoogleAdsException: API request failure during iteration
+            DataProcessingError: Response processing failure during iteration
+        """
+        if not customer_id or not isinstance(customer_id, str):
+            raise ValidationError("customer_id must be a non-empty string")
+
+        if not isinstance(report_model, dict) or 'report_name' not in report_model:
+            raise ValidationError("report_model must be a dict with 'report_name' key")
+
+        query_str = self._build_gads_query(report_model, start_date, end_date,
+                                           filter_zero_impressions=filter_zero_impressions)
+
+        try:
+            for records in self._iter_record_batches(customer_id, query_str,
+                                                     report_model["select"], column_naming):
+                yield from records
+        except GoogleAdsException:
+            raise
+        except Exception as e:
+            raise DataProcessingError(
+                "Failed to process API response stream",
+                original_error=e,
+                customer_id=customer_id
+            ) from e
+
+    def _iter_record_batches(self, customer_id: str, query_str: str,
+                             select: list[str] | tuple[str, ...],
+                             column_naming: str) -> Iterator[RecordList]:
+        """
+        Runs the search stream and yields one list of records per batch.
+
+        This is the shared fetch loop behind the streaming consumers
+        (iter_gads_report, CSV and Parquet export): it builds the request,
+        compiles and specializes the row extractor on the first row, and
+        converts each server batch into ready-named records. Exceptions are
+        left untouched for the caller to classify.
+
+        Parameters:
+        - customer_id (str): Google Ads customer ID.
+        - query_str (str): Fully built GAQL query.
+        - select: Selected field paths from the report model.
+        - column_naming (str): Column naming convention used for record keys.
+
+        Yields:
+        - RecordList: Records of one stream batch; empty batches are skipped.
+        """
+        search_request = self._new_stream_request()
+        search_request.customer_id = customer_id  # type: ignore
+        search_request.query = query_str  # type: ignore
+
+        extractor = self._compile_row_extractor(tuple(select),
+                                                self._normalize_naming(column_naming))
+
+        stream = self.service.search_stream(search_request)
+
+        specialized = None
+        for batch in stream:
+            rows = batch.results
+            if not rows:
+                continue
+            if specialized is None:
+                specialized = self._specialize_extractor(extractor, rows[0])
+
+            yield [
+                {field: extract(row) for field, extract in specialized}
+                for row in rows
+            ]
+
+    @retry_on_api_error(max_attempts=3, base_delay=1.0)
+    def stream_gads_report_to_csv(self, customer_id: str, report_model: ReportModel,
+                                  start_date: date, end_date: date, filepath: str,
+                                  filter_zero_impressions: bool = True,
+                                  column_naming: str = "snake_case") -> str:
+        """
+        Streams Google Ads report data page-by-page directly into a CSV file.
+
+        Unlike get_gads_report, this method never accumulates the full result set
+        in memory: each API page is processed and appended to an already-open
+        buffered file handle (1 MiB write buffer), which roughly halves peak
+        memory on multi-100k-row reports.
+
+        Parameters:
+            customer_id (str): Google Ads customer ID
+            report_model (ReportModel): Report configuration (same as get_gads_report)
+            start_date (date): Report start date (inclusive)
+            end_date (date): Report end date (inclusive)
+            filepath (str): Path of the CSV file to write ('.csv' appended if missing)
+            filter_zero_impressions (bool): Remove rows with zero impressions
+            column_naming (str): Column naming convention ("snake_case" or "camelCase")
+
+        Returns:
+            str: Full path of the written CSV file
+
+        Raises:
+            ValidationError: Invalid parameters or report model
+            AuthenticationError: API authentication failure
+            DataProcessingError: Response processing failure
+        """
+        if not customer_id or not isinstance(customer_id, str):
+            raise ValidationError("customer_id must be a non-empty string")
+
+        if not isinstance(report_model, dict) or 'report_name' not in report_model:
+            raise ValidationError("report_model must be a dict with 'report_name' key")
+
+        if not filepath.endswith('.csv'):
+            filepath += '.csv'
+
+        query_str = self._build_gads_query(report_model, start_date, end_date,
+                                           filter_zero_impressions=filter_zero_impressions)
+
+        logging.info("Executing search stream request (streaming to CSV)...")
+
+        total_rows = 0
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+            writer = None
+            fieldnames: list[str] = []
+
+            try:
+                for records in self._iter_record_batches(customer_id, query_str,
+                                                         report_model["select"], column_naming):
+                    if writer is None:
+                        fieldnames = list(records[0].keys())
+                        writer = csv.writer(csvfile)
+                        writer.writerow(fieldnames)
+                    writer.writerows(
+                        [record.get(field) for field in fieldnames]
+                        for record in records
+                    )
+                    total_rows += len(records)
+
+            except GoogleAdsException:
+                # Let the retry decorator classify and retry API-level failures
+                raise
+            except Exception as e:
+                raise DataProcessingError(
+                    "Failed to stream API response to CSV",
+                    original_error=e,
+                    customer_id=customer_id
+                ) from e
+
+        if total_rows > 0:
+            logging.info(f"Finished streaming {total_rows} rows to {filepath}")
+        else:
+            logging.info("Response has no 'results' with requested parameters")
+
+        return filepath
+
+    @retry_on_api_error(max_attempts=3, base_delay=1.0)
+    def get_gads_report_to_parquet(self, customer_id: str, report_model: ReportModel,
+                                   start_date: date, end_date: date, filepath: str,
+                                   filter_zero_impressions: bool = True,
+                                   column_naming: str = "snake_case",
+                                   chunk_size: int = 64 * 1024) -> str:
+        """
+        Streams Google Ads report data into a Parquet file in fixed-size chunks.
+
+        Rows are buffered chunk_size at a time and flushed through a
+        pyarrow.parquet.ParquetWriter, so peak memory stays bounded by one
+        chunk regardless of the total report size. Parquet output is also
+        typically 5-10x smaller on disk than CSV and much faster to load
+        downstream. Requires the optional pyarrow dependency.
+
+        Parameters:
+            customer_id (str): Google Ads customer ID
+            report_model (ReportModel): Report configuration (same as get_gads_report)
+            start_date (date): Report start date (inclusive)
+            end_date (date): Report end date (inclusive)
+            filepath (str): Path of the Parquet file to write ('.parquet' appended if missing)
+            filter_zero_impressions (bool): Filter rows with zero impressions server-side
+            column_naming (str): Column naming convention ("snake_case" or "camelCase")
+            chunk_size (int): Rows per Parquet row group flush (default 64k)
+
+        Returns:
+            str: Full path of the written Parquet file
+
+        Raises:
+            ConfigurationError: pyarrow is not installed
+            ValidationError: Invalid parameters or report model
+            AuthenticationError: API authentication failure
+            DataProcessingError: Response processing failure
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ConfigurationError(
+                "pyarrow is required for Parquet output. Install it with 'pip install pyarrow'",
+                original_error=e
+            ) from e
+
+        if not customer_id or not isinstance(customer_id, str):
+            raise ValidationError("customer_id must be a non-empty string")
+
+        if not isinstance(report_model, dict) or 'report_name' not in report_model:
+            raise ValidationError("report_model must be a dict with 'report_name' key")
+
+        if not filepath.endswith('.parquet'):
+            filepath += '.parquet'
+
+        query_str = self._build_gads_query(report_model, start_date, end_date,
+                                           filter_zero_impressions=filter_zero_impressions)
+
+        logging.info("Executing search stream request (streaming to Parquet)...")
+
+        writer = None
+        total_rows = 0
+
+        def flush_chunk(chunk: RecordList) -> None:
+            nonlocal writer, total_rows
+
+            fieldnames = list(chunk[0].keys())
+            columns = {field: [record.get(field) for record in chunk] for field in fieldnames}
+            record_batch = pa.RecordBatch.from_pydict(columns)
+
+            if writer is None:
+                writer = pq.ParquetWriter(filepath, record_batch.schema)
+            writer.write_batch(record_batch)
+            total_rows += len(chunk)
+
+        buffer: RecordList = []
+        try:
+            for records in self._iter_record_batches(customer_id, query_str,
+                                                     report_model["select"], column_naming):
+                buffer.extend(records)
+                if len(buffer) >= chunk_size:
+                    flush_chunk(buffer)
+                    buffer = []
+
+            if buffer:
+                flush_chunk(buffer)
+
+        except GoogleAdsException:
+            # Let the retry decorator classify and retry API-level failures
+            raise
+        except Exception as e:
+            raise DataProcessingError(
+                "Failed to stream API response to Parquet",
+                original_error=e,
+                customer_id=customer_id
+            ) from e
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if total_rows > 0:
+            logging.info(f"Finished streaming {total_rows} rows to {filepath}")
+        else:
+            logging.info("Response has no 'results' with requested parameters")
+
+        return filepath
+
+    @retry_on_api_error(max_attempts=3, base_delay=1.0)
+    def get_gads_report_arrow(self, customer_id: str, report_model: ReportModel,
+                              start_date: date, end_date: date,
+                              filter_zero_impressions: bool = True,
+                              column_naming: str = "snake_case") -> Any:
+        """
+        Retrieves Google Ads report data as a pyarrow.Table.
+
+        The stream is accumulated columnar (one list per selected field) and
+        wrapped once into an Arrow table, skipping the per-row record dicts
+        entirely. Useful when the destination is Parquet, Arrow IPC or a
+        DataFrame library: pq.write_table(table, path) or table.to_pandas()
+        involve no further per-cell Python work. Requires the optional
+        pyarrow dependency.
+
+        Parameters:
+            customer_id (str): Google Ads customer ID
+            report_model (ReportModel): Report configuration (same as get_gads_report)
+            start_date (date): Report start date (inclusive)
+            end_date (date): Report end date (inclusive)
+            filter_zero_impressions (bool): Filter rows with zero impressions server-side
+            column_naming (str): Column naming convention ("snake_case" or "camelCase")
+
+        Returns:
+            Any: pyarrow.Table with one column per selected field
+
+        Raises:
+            ConfigurationError: pyarrow is not installed
+            ValidationError: Invalid parameters or report model
+            AuthenticationError: API authentication failure
+            DataProcessingError: Response processing failure
         """
-        # Convert datetime objs to strings
-        start_date_iso = start_date.isoformat() if isinstance(start_date, (date, datetime)) else start_date
-        end_date_iso = end_date.isoformat() if isinstance(end_date, (date, datetime)) else end_date
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ConfigurationError(
+                "pyarrow is required for Arrow output. Install it with 'pip install pyarrow'",
+                original_error=e
+            ) from e
+
+        if not customer_id or not isinstance(customer_id, str):
+            raise ValidationError("customer_id must be a non-empty string")
+
+        if not isinstance(report_model, dict) or 'report_name' not in report_model:
+            raise ValidationError("report_model must be a dict with 'report_name' key")
+
+        query_str = self._build_gads_query(report_model, start_date, end_date,
+                                           filter_zero_impressions=filter_zero_impressions)
+
+        search_request = self._new_stream_request()
+        search_request.customer_id = customer_id  # type: ignore
+        search_request.query = query_str  # type: ignore
 
-        # Initialize the query string with the SELECT and FROM clauses and append segments.date
-        query_str = f"SELECT {', '.join(report_model['select'])} FROM {report_model['from']}"
-        query_str += f" WHERE segments.date BETWEEN '{start_date_iso}' AND '{end_date_iso}'"
+        extractor = self._compile_row_extractor(tuple(report_model["select"]),
+                                                self._normalize_naming(column_naming))
+        columns: dict[str, list] = {field: [] for field, _ in extractor}
 
-        # Add the WHERE clause if it exists in the query_dict
-        if "where" in report_model:
-            query_str += f" AND {report_model['where']}"
+        logging.info("Executing search stream request (Arrow output)...")
+        stream = self.service.search_stream(search_request)
 
-        # Add the ORDER BY clause
-        if "order_by" in report_model:
-            query_str += f" ORDER BY segments.date ASC, {report_model['order_by']} DESC"
+        specialized = None
+        try:
+            for batch in stream:
+                rows = batch.results
+                if rows and specialized is None:
+                    specialized = self._specialize_extractor(extractor, rows[0])
+
+                for field, extract in specialized or ():
+                    column = columns[field]
+                    column.extend(extract(row) for row in rows)
+
+        except GoogleAdsException:
+            # Let the retry decorator classify and retry API-level failures
+            raise
+        except Exception as e:
+            raise DataProcessingError(
+                "Failed to process API response stream",
+                original_error=e,
+                customer_id=customer_id
+            ) from e
+
+        table = pa.table(columns)
+        logging.info(f"Finished fetching Arrow table with {table.num_rows} rows")
+        return table
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _compile_query_template(select: tuple[str, ...], from_table: str,
+                                where: str | None, order_by: str | None,
+                                filter_zero_impressions: bool) -> str:
+        """
+        Compiles the date-independent part of a GAQL query.
+
+        All arguments except the date range are fixed per report model, so the
+        join/concatenation work is memoized and repeated calls for the same
+        model only pay a cache lookup plus one str.format for the dates.
+
+        Parameters:
+        - select (tuple[str, ...]): Selected field paths, in order.
+        - from_table (str): GAQL FROM resource.
+        - where (str | None): Optional extra WHERE condition.
+        - order_by (str | None): Optional ORDER BY field.
+        - filter_zero_impressions (bool): Append 'metrics.impressions > 0'.
+
+        Returns:
+        - str: Query template with {start_date} and {end_date} placeholders.
+        """
+        query_str = f"SELECT {', '.join(select)} FROM {from_table}"
+        query_str += " WHERE segments.date BETWEEN '{start_date}' AND '{end_date}'"
+
+        if where:
+            query_str += f" AND {where}"
+
+        # Filter zero-impression rows at the server so they are never
+        # serialized, transferred, or decoded client-side
+        if filter_zero_impressions:
+            if "metrics.impressions" in select:
+                query_str += " AND metrics.impressions > 0"
+            else:
+                logging.info(
+                    "Skipping zero impressions filter: report does not select 'metrics.impressions'.")
+
+        if order_by:
+            query_str += f" ORDER BY segments.date ASC, {order_by} DESC"
         else:
             query_str += " ORDER BY segments.date ASC"
 
         return query_str
 
+    def _build_gads_query(self, report_model: ReportModel, start_date: date, end_date: date,
+                          filter_zero_impressions: bool = False) -> str:
+        """
+        Creates a query string for the Google Ads API.
+
+        The date-independent skeleton is compiled once per report model (see
+        _compile_query_template); only the date range is substituted per call.
+
+        Parameters:
+        - report_model (ReportModel): The report model specifying dimensions, metrics, etc.
+        - start_date (date): Start date for the report.
+        - end_date (date): End date for the report.
+        - filter_zero_impressions (bool): Append 'metrics.impressions > 0' to the
+          WHERE clause so zero-impression rows are filtered server-side.
+
+        Returns:
+        - str: The constructed query string.
+        """
+        # Convert datetime objs to strings; EAFP since the typed API always
+        # passes date objects and pre-formatted strings are the rare fallback
+        try:
+            start_date_iso = start_date.isoformat()
+        except AttributeError:
+            start_date_iso = str(start_date)
+        try:
+            end_date_iso = end_date.isoformat()
+        except AttributeError:
+            end_date_iso = str(end_date)
+
+        template = self._compile_query_template(
+            tuple(report_model["select"]), report_model["from"],
+            report_model.get("where"), report_model.get("order_by"),
+            filter_zero_impressions)
+
+        return template.format(start_date=start_date_iso, end_date=end_date_iso)
+
     @retry_on_api_error(max_attempts=3, base_delay=1.0)
     def _get_google_ads_response(self, customer_id: str, report_model: ReportModel,
-                                 start_date: date, end_date: date) -> APIResponse:
+                                 start_date: date, end_date: date,
+                                 filter_zero_impressions: bool = False,
+                                 column_naming: str = "snake_case") -> APIResponse:
         """
-        Retrieves GAds report data using GoogleAdsClient().get_service().search() .
+        Retrieves GAds report data using GoogleAdsClient().get_service().search_stream() .
 
         Parameters:
         - customer_id (str): The customer ID for Google Ads.
         - report_model (ReportModel): The report model specifying dimensions, metrics, etc.
         - start_date (date): Start date for the report.
         - end_date (date): End date for the report.
+        - column_naming (str): Column naming convention used for record keys.
 
         Returns:
         - APIResponse: GAds report data dict containing keys `results`, `totalResultsCount`, and `fieldMask`.
@@ -253,16 +838,14 @@ class GAdsReport:
         if not isinstance(report_model, dict) or 'report_name' not in report_model:
             raise ValidationError("report_model must be a dict with 'report_name' key")
 
-        # Display request parameters
-        print("[ Request parameters ]\n"
-              f"Resource: {type(self.service).__name__}\n"
-              f"Customer_id: {customer_id}\n"
-              f"Report_model: {report_model['report_name']}\n"
-              f"Date range: from {start_date.isoformat()} to {end_date.isoformat()}\n"
-              )
+        # Log request parameters; lazy %s formatting only renders when the
+        # INFO level is actually enabled
+        logging.info("Requesting report '%s' for customer %s, from %s to %s",
+                     report_model['report_name'], customer_id, start_date, end_date)
 
         try:
-            query_str = self._build_gads_query(report_model, start_date, end_date)
+            query_str = self._build_gads_query(report_model, start_date, end_date,
+                                               filter_zero_impressions=filter_zero_impressions)
         except Exception as e:
             raise ValidationError(
                 "Failed to build query string",
@@ -270,11 +853,9 @@ class GAdsReport:
                 report_model=report_model.get('report_name', 'unknown')
             ) from e
 
-        search_request = self.client.get_type("SearchGoogleAdsRequest")
+        search_request = self._new_stream_request()
         search_request.customer_id = customer_id  # type: ignore
         search_request.query = query_str  # type: ignore
-        search_request.search_settings.return_total_results_count = True  # type: ignore
-        # search_request.page_size = 100 # Deprecated in API v17, default as 10_000
         logging.debug(search_request)  # DEBUG only
 
         full_response_dict: APIResponse = {
@@ -283,58 +864,166 @@ class GAdsReport:
             "fieldMask": "",
         }
 
-        # Execute the query and retrieve the results
+        # Pre-compile one attribute getter per selected field so the per-row
+        # work is a handful of C-level lookups instead of a reflective
+        # MessageToDict walk over the whole page proto; record keys are the
+        # final transformed column names
+        extractor = self._compile_row_extractor(tuple(report_model["select"]),
+                                                self._normalize_naming(column_naming))
+
+        # Execute the query as one server-streaming RPC: batches arrive as the
+        # server produces them, with no per-page round-trips or page tokens.
         # Note: The retry decorator will handle GoogleAdsException retries
-        # Execute the query to fetch the first page of data
-        logging.info("Executing search request...")
-        response = self.service.search(search_request)
-
-        # Check if response has headers and results
-        if hasattr(response, "field_mask") and response.total_results_count > 0:
-            while True:
-                try:
-                    response_dict = MessageToDict(response._pb)
-                    page_results = response_dict.get("results", [])
-                    # Ensure page_results is a list
-                    if not isinstance(page_results, list):
-                        page_results = [page_results]
-                    full_response_dict["results"].extend(page_results)
-
-                    logging.info(
-                        f"Request returned {len(full_response_dict["results"])}/{response.total_results_count} rows")
-
-                    if response.next_page_token == "":
-                        logging.debug("Response has no next_page_token")
-                        break
-                    else:
-                        logging.debug(f"Executing search request with next_page_token: '{response.next_page_token}'")
-                        search_request.page_token = response.next_page_token  # type: ignore
-                        response = self.service.search(search_request)
-
-                except Exception as e:
-                    raise DataProcessingError(
-                        "Failed to process API response pagination",
-                        original_error=e,
-                        customer_id=customer_id
-                    ) from e
-
-            full_response_dict["totalResultsCount"] = response.total_results_count
-            full_response_dict["fieldMask"] = response_dict.get("fieldMask", "")
-
-            logging.info(f"Finished fetching full Response with {len(full_response_dict['results'])} rows")
+        logging.info("Executing search stream request...")
+        stream = self.service.search_stream(search_request)
+
+        results = full_response_dict["results"]
+        field_mask = ""
+        specialized = None
+        # Rate-limit progress logs to once per second so large streams don't
+        # pay one log record (plus formatting) per batch
+        last_progress = time.monotonic()
+        try:
+            for batch in stream:
+                rows = batch.results
+                if not rows:
+                    continue
+                if specialized is None:
+                    specialized = self._specialize_extractor(extractor, rows[0])
+
+                results.extend(
+                    {field: extract(row) for field, extract in specialized}
+                    for row in rows
+                )
+                if not field_mask:
+                    field_mask = ",".join(batch.field_mask.paths)
+
+                now = time.monotonic()
+                if now - last_progress > 1.0:
+                    logging.info("Stream returned %d rows so far", len(results))
+                    last_progress = now
+
+        except GoogleAdsException:
+            # Let the retry decorator classify and retry API-level failures
+            raise
+        except Exception as e:
+            raise DataProcessingError(
+                "Failed to process API response stream",
+                original_error=e,
+                customer_id=customer_id
+            ) from e
+
+        if results:
+            # search_stream has no total_results_count; the stream is complete
+            # here, so the row count is authoritative
+            full_response_dict["totalResultsCount"] = len(results)
+            full_response_dict["fieldMask"] = field_mask
+
+            logging.info(f"Finished fetching full Response with {len(results)} rows")
 
         else:
             logging.info("Response has no 'results' with requested parameters")
 
         return full_response_dict
 
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _compile_row_extractor(select: tuple[str, ...],
+                               naming_convention: str = "snake_case") -> tuple[tuple[str, Any], ...]:
+        """
+        Pre-compiles one attribute getter per selected field.
+
+        The select fields in a report model are dotted proto paths (e.g.
+        'ad_group_ad.ad.id'), which map 1:1 onto the attributes of each
+        GoogleAdsRow, so a single attrgetter per field extracts exactly the
+        requested data without reflecting over the full message. The dict
+        keys are the final transformed column names, so records are born with
+        their database-ready names and no rename pass runs per result set.
+        Compiled extractors are memoized per (select, naming) pair, so
+        repeated calls for the same report model reuse the same getters.
+
+        Parameters:
+        - select (tuple[str, ...]): Selected field paths, in order.
+        - naming_convention (str): "snake_case" or "camelcase" (pre-validated)
+
+        Returns:
+        - tuple[tuple[str, Any], ...]: (column name, attrgetter) pairs in select order
+        """
+        renames = GAdsReport._compile_column_renames(select, naming_convention)
+        return tuple((renames[field], attrgetter(field)) for field in select)
+
+    @staticmethod
+    def _specialize_extractor(extractor: tuple[tuple[str, Any], ...],
+                              sample_row: Any) -> list[tuple[str, Any]]:
+        """
+        Specializes the compiled extractor per field using one sample row.
+
+        Field types are fixed by the report schema, so the first row is enough
+        to pick the right conversion once per field: text fields fuse the
+        encoding cleanup into extraction (no separate cleaning pass over the
+        records), other scalar fields keep the bare attrgetter, enum fields
+        read .name, and anything else goes through the generic
+        _coerce_proto_value.
+
+        Parameters:
+        - extractor: (field path, attrgetter) pairs from _compile_row_extractor
+        - sample_row: One GoogleAdsRow from the first non-empty batch
+
+        Returns:
+        - list[tuple[str, Any]]: (field path, extraction callable) pairs
+        """
+        specialized = []
+        for field, getter in extractor:
+            value = getter(sample_row)
+            if isinstance(value, str):
+                def extract(row: Any, _getter: Any = getter) -> Any:
+                    return GAdsReport._clean_text_value(_getter(row))
+            elif isinstance(value, enum.Enum):
+                def extract(row: Any, _getter: Any = getter) -> Any:
+                    return _getter(row).name
+            elif value is None or isinstance(value, (bytes, int, float, bool)):
+                extract = getter
+            else:
+                def extract(row: Any, _getter: Any = getter) -> Any:
+                    return GAdsReport._coerce_proto_value(_getter(row))
+            specialized.append((field, extract))
+        return specialized
+
+    @staticmethod
+    def _coerce_proto_value(value: Any) -> Any:
+        """
+        Converts a proto-plus field value to a plain Python value.
+
+        Enums become their symbolic names (matching the API's JSON mapping),
+        repeated fields become lists, and scalars pass through unchanged.
+
+        Parameters:
+        - value: Raw value read from a GoogleAdsRow attribute
+
+        Returns:
+        - Any: Database-friendly Python value
+        """
+        if isinstance(value, enum.Enum):
+            return value.name
+        if value is None or isinstance(value, (str, bytes, int, float, bool)):
+            return value
+        try:
+            # Repeated fields (e.g. final_urls) expose list iteration
+            return list(value)
+        except TypeError:
+            return value
+
     def _convert_response_to_records(self, response: APIResponse,
                                      report_model: ReportModel) -> RecordList:
         """
-        Converts the Google Ads API protobuf response to list of dictionaries.
+        Unwraps and validates the extracted Google Ads report records.
+
+        Records are already flat (one key per selected field path) because
+        extraction reads exactly the fields in report_model['select'] from
+        each protobuf row.
 
         Parameters:
-        - response: The Google Ads API response in protobuf dict format.
+        - response: APIResponse dict with 'results' holding flat records.
         - report_model (ReportModel): The custom report model specifying dimensions.
 
         Returns:
@@ -351,17 +1040,7 @@ class GAdsReport:
                 logging.info("No results returned, creating empty list")
                 return []
 
-            # Flatten nested dictionaries from the response
-            records = []
-            for result in response["results"]:
-                flattened_record = self._flatten_dict(result)
-                # Remove resource name fields
-                cleaned_record = {
-                    k: v for k, v in flattened_record.items()
-                    if not k.endswith(".resourceName")
-                }
-                records.append(cleaned_record)
-
+            records: RecordList = response["results"]
             return records
 
         except Exception as e:
@@ -371,86 +1050,140 @@ class GAdsReport:
                 report_name=report_model.get('report_name', 'unknown')
             ) from e
 
-    def _flatten_dict(self, nested_dict: Record, parent_key: str = "", sep: str = ".") -> Record:
+    # Bare metric names left after the metrics. prefix is stripped at rename
+    # time (identical under both naming conventions)
+    _NUMERIC_FIELD_NAMES = frozenset((
+        "id", "impressions", "clicks", "conversions", "interactions", "ctr",
+        "average_cpc", "average_cpm", "average_cpv",
+        "averageCpc", "averageCpm", "averageCpv",
+    ))
+
+    # Column-name endings that identify numeric report columns under either
+    # naming convention (e.g. cost_micros/costMicros, campaign_id/campaignId)
+    _NUMERIC_FIELD_SUFFIXES = (
+        "_micros", "Micros", "_rate", "Rate", "_score", "Score",
+        "_share", "Share", "_value", "Value", "_views", "Views",
+        "_id", "Id", "_ctr", "Ctr",
+        "_impressions", "Impressions", "_clicks", "Clicks",
+        "_conversions", "Conversions", "_interactions", "Interactions",
+    )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _classify_text_columns(columns: tuple[str, ...]) -> frozenset[str]:
         """
-        Flattens nested dictionary structure.
+        Splits report columns into text vs numeric by field-name convention.
+
+        Metrics and id/rate/micros-style fields are numeric in the Google Ads
+        schema; everything else (names, statuses, dates, types) is text.
+        Columns are matched on their final renamed form (see
+        _compile_column_renames), in either naming convention.
 
         Parameters:
-        - nested_dict: The nested dictionary to flatten
-        - parent_key: The parent key for recursion
-        - sep: Separator for nested keys
+        - columns (tuple[str, ...]): Final (renamed) column names
 
         Returns:
-        - Record: Flattened dictionary
+        - frozenset[str]: The subset of columns holding text values
         """
-        items: list[tuple[str, Any]] = []
-        for k, v in nested_dict.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            if isinstance(v, dict):
-                items.extend(self._flatten_dict(v, new_key, sep=sep).items())
-            else:
-                items.append((new_key, v))
-        return dict(items)
+        return frozenset(
+            col for col in columns
+            if not (col in GAdsReport._NUMERIC_FIELD_NAMES
+                    or col.endswith(GAdsReport._NUMERIC_FIELD_SUFFIXES))
+        )
 
-    def _is_zero_impression_record(self, record: Record) -> bool:
+    def _handle_missing_values(self, records: RecordList,
+                               fill_object_values: str = "") -> RecordList:
         """
-        Checks if a record has zero impressions.
+        Handles missing values appropriately for database compatibility.
+
+        Only text columns are filled: numeric columns keep None so database
+        NULLs stay NULL and downstream math never sees a numeric column
+        polluted with empty strings. Columns are classified once per result
+        set by field-name convention (see _classify_text_columns). With the
+        default empty-string fill the method is a no-op and returns the
+        records untouched instead of rebuilding them.
 
         Parameters:
-        - record: The record to check
+        - records: List of records to process
+        - fill_object_values: Value to fill None in text fields (empty string by default)
 
         Returns:
-        - bool: True if record has zero impressions
+        - RecordList: Processed records
         """
-        impression_value = record.get("metrics.impressions")
+        if not records or fill_object_values == "":
+            return records
 
-        if impression_value is None:
-            return True
+        text_columns = self._classify_text_columns(tuple(records[0].keys()))
 
-        # Fast path for common cases
-        if impression_value == 0 or impression_value == "0":
-            return True
+        # Fill in place: the records were just built by extraction, so no
+        # caller holds a reference that must stay untouched
+        for record in records:
+            for key in text_columns:
+                if key in record and record[key] is None:
+                    record[key] = fill_object_values
 
-        # Handle various zero representations
-        try:
-            return float(impression_value) == 0.0
-        except (ValueError, TypeError):
-            # If can't convert to float, check string representations
-            str_value = str(impression_value).strip().lower()
-            return str_value in {"0.0", "", "none", "null"}
+        return records
 
-    def _handle_missing_values(self, records: RecordList,
-                               fill_object_values: str = "") -> RecordList:
+    @staticmethod
+    def _convert_micros_values(records: RecordList) -> RecordList:
         """
-        Handles missing values appropriately for database compatibility.
+        Converts *_micros columns from micro-units to standard currency units.
+
+        The affected columns are identified once from the first record, then
+        every value is divided by 1,000,000 in a single pass. Values are
+        mutated in place since the records were just built by extraction.
 
         Parameters:
         - records: List of records to process
-        - fill_object_values: Value to fill None in text fields (empty string by default)
 
         Returns:
-        - RecordList: Processed records
+        - RecordList: Records with micro-unit values converted to floats
         """
         if not records:
             return records
 
-        processed_records = []
+        # Covers both snake_case (cost_micros) and camelCase (costMicros) keys
+        micros_columns = [col for col in records[0] if col.endswith(("_micros", "Micros"))]
+        if not micros_columns:
+            return records
+
         for record in records:
-            processed_record = {}
-            for key, value in record.items():
-                # Handle None values for text fields
-                if value is None and fill_object_values != "":
-                    processed_record[key] = fill_object_values
-                else:
-                    processed_record[key] = value
-            processed_records.append(processed_record)
+            for col in micros_columns:
+                value = record[col]
+                if value is not None:
+                    record[col] = value / 1_000_000
 
-        return processed_records
+        return records
+
+    @staticmethod
+    def _clean_text_value(value: str) -> str:
+        """
+        Cleans one text value for character encoding issues.
+
+        Removes non-ASCII characters, null bytes, and normalizes whitespace;
+        output is truncated to the 255-character database field limit.
+
+        Parameters:
+        - value: Text value to clean
+
+        Returns:
+        - str: Cleaned text value
+        """
+        return (
+            value.encode('ascii', 'ignore')
+            .decode('ascii')
+            .translate(_TEXT_CLEAN_TABLE)
+            .strip()[:255]  # Truncate to DB field limit
+        )
 
     def _clean_text_encoding(self, records: RecordList) -> RecordList:
         """
         Cleans text values for character encoding issues.
 
+        Extraction already cleans text fields in-line (see
+        _specialize_extractor); this pass remains for records produced
+        outside the extraction pipeline.
+
         Parameters:
         - records: List of records to process
 
@@ -461,36 +1194,92 @@ class GAdsReport:
             return records
 
         try:
-            cleaned_records = []
-            for record in records:
-                cleaned_record = {}
-                for key, value in record.items():
-                    if isinstance(value, str):
-                        # Optimized text cleaning for serverless environments
-                        # Remove non-ASCII characters, null bytes, and normalize whitespace
-                        cleaned_value = (
-                            value.encode('ascii', 'ignore')
-                            .decode('ascii')
-                            .replace('\x00', '')
-                            .replace('\r', ' ')
-                            .replace('\n', ' ')
-                            .strip()[:255]  # Truncate to DB field limit
-                        )
-                        cleaned_record[key] = cleaned_value
-                    else:
-                        cleaned_record[key] = value
-                cleaned_records.append(cleaned_record)
-            return cleaned_records
+            clean = self._clean_text_value
+            return [
+                {key: clean(value) if isinstance(value, str) else value
+                 for key, value in record.items()}
+                for record in records
+            ]
 
         except Exception as e:
             logging.warning(f"Character encoding cleanup failed: {e}")
             return records
 
+    @staticmethod
+    def _snake_to_camel(name: str) -> str:
+        """
+        Converts a snake_case identifier to camelCase.
+
+        Parameters:
+        - name: Identifier such as 'ad_group_ad'
+
+        Returns:
+        - str: camelCase form such as 'adGroupAd'
+        """
+        head, *rest = name.split("_")
+        return head + "".join(part.capitalize() for part in rest)
+
+    @staticmethod
+    def _normalize_naming(naming_convention: str) -> str:
+        """
+        Validates a column naming convention, defaulting to snake_case.
+
+        Parameters:
+        - naming_convention (str): Requested convention
+
+        Returns:
+        - str: Lowercased convention ("snake_case" or "camelcase")
+        """
+        if naming_convention.lower() not in ["snake_case", "camelcase"]:
+            logging.warning(f"Invalid column_naming '{naming_convention}'. Using 'snake_case' as default")
+            return "snake_case"
+        return naming_convention.lower()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _compile_column_renames(columns: tuple[str, ...],
+                                naming_convention: str) -> dict[str, str]:
+        """
+        Builds the column rename mapping for one set of column names.
+
+        Memoized per column tuple so repeated reports against the same model
+        skip the per-column string transformations entirely.
+
+        Parameters:
+        - columns (tuple[str, ...]): Original column names (dotted proto paths)
+        - naming_convention (str): "snake_case" or "camelcase" (pre-validated)
+
+        Returns:
+        - dict[str, str]: Mapping of original to transformed column names
+        """
+        renames = {}
+        for col in columns:
+            # One anchored regex pass strips the resource prefix instead of
+            # three chained .replace scans per column
+            clean_col = _COLUMN_PREFIX_RE.sub("", col)
+
+            if naming_convention == "snake_case":
+                # Convert to snake_case
+                new_col = clean_col.replace(".", "_")
+
+            else:
+                # Convert each snake_case path segment to camelCase
+                parts = [GAdsReport._snake_to_camel(part) for part in clean_col.split(".")]
+                new_col = parts[0] + "".join(part[:1].upper() + part[1:] for part in parts[1:])
+
+            renames[col] = new_col
+
+        return renames
+
     def _transform_column_names(self, records: RecordList,
                                 naming_convention: str = "snake_case") -> RecordList:
         """
         Transforms column names according to the specified naming convention.
 
+        Every record shares the same columns, so the rename mapping is computed
+        once from the first record and applied as a plain dict lookup per row
+        instead of repeating the string transformations for every record.
+
         Parameters:
             records: List of records with original column names
             naming_convention (str):
@@ -499,41 +1288,19 @@ class GAdsReport:
         Returns:
             RecordList: Records with transformed column names
         """
-        # Validate column naming parameter
-        if naming_convention.lower() not in ["snake_case", "camelcase"]:
-            naming_convention = "snake_case"
-            logging.warning(f"Invalid column_naming '{naming_convention}'. Using 'snake_case' as default")
+        naming_convention = self._normalize_naming(naming_convention)
 
         if not records:
             return records
 
         try:
-            transformed_records = []
-            for record in records:
-                transformed_record = {}
-                for col, value in record.items():
-                    if naming_convention.lower() == "snake_case":
-                        # Remove prefixes and convert to snake_case
-                        new_col = (col.replace("segments.", "")
-                                   .replace("adGroupCriterion.", "")
-                                   .replace("metrics.", "")
-                                   .replace(".", "_")
-                                   .lower())
-
-                    elif naming_convention.lower() == "camelcase":
-                        # Remove prefixes and convert to camelCase
-                        clean_col = (col.replace("segments.", "")
-                                     .replace("adGroupCriterion.", "")
-                                     .replace("metrics.", ""))
-
-                        # Convert to camelCase
-                        parts = clean_col.split(".")
-                        new_col = parts[0] + "".join(part.capitalize() for part in parts[1:])
-
-                    transformed_record[new_col] = value
-                transformed_records.append(transformed_record)
-
-            return transformed_records
+            renames = self._compile_column_renames(tuple(records[0].keys()),
+                                                   naming_convention)
+
+            return [
+                {renames[col]: value for col, value in record.items()}
+                for record in records
+            ]
 
         except Exception as e:
             logging.warning(f"Column naming transformation failed: {e}")
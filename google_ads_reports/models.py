@@ -3,7 +3,7 @@ Google Ads report models module.
 
 This module contains pre-configured report models for different types of Google Ads reports.
 """
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 
 class GAdsReportModel:
@@ -257,7 +257,7 @@ class GAdsReportModel:
 
 
 # Factory function for creating custom report models
-def create_custom_report(report_name: str, select: List[str], from_table: str,
+def create_custom_report(report_name: str, select: Sequence[str], from_table: str,
                          order_by: Optional[str] = None, where: Optional[str] = None,
                          table_name: Optional[str] = None,
                          date_column: str = "date") -> Dict[str, Any]:
@@ -266,7 +266,8 @@ def create_custom_report(report_name: str, select: List[str], from_table: str,
 
     Args:
         report_name (str): Name of the custom report
-        select (List[str]): List of fields to select
+        select (Sequence[str]): Fields to select (a shared tuple avoids
+            per-call list allocations)
         from_table (str): Table to query from
         order_by (Optional[str]): Field to order by (besides date)
         where (Optional[str]): Additional WHERE clause conditions